@@ -1,6 +1,6 @@
 """
 M5StickC Plus2 - Event Display MVP
-Displays crypto event data from payload dict
+Displays crypto event data from example payloads
 No networking - local simulation only
 """
 
@@ -11,28 +11,30 @@ from M5 import *
 # EVENT PAYLOAD EXAMPLES
 # ============================================
 
-EXAMPLE_PAYLOADS = [
-    {
-        "event_type": "NEW_LISTING",
-        "confidence": "HIGH",
-        "symbol": "PEPE/USDT"
-    },
-    {
-        "event_type": "VOLUME_SPIKE",
-        "confidence": "MEDIUM",
-        "symbol": "SOL/USDT"
-    },
-    {
-        "event_type": "WHALE_BUY",
-        "confidence": "LOW",
-        "symbol": "DOGE/USDT"
-    },
-    {
-        "event_type": "PRICE_BREAKOUT",
-        "confidence": "HIGH",
-        "symbol": "BTC/USDT"
-    }
-]
+# Stored column-wise: payload i is (EXAMPLE_EVENT_TYPES[i],
+# EXAMPLE_CONFIDENCES[i], EXAMPLE_SYMBOLS[i]). Three tuples of shared
+# strings take far less RAM than one dict per payload.
+EXAMPLE_EVENT_TYPES = ("NEW_LISTING", "VOLUME_SPIKE", "WHALE_BUY", "PRICE_BREAKOUT")
+EXAMPLE_CONFIDENCES = ("HIGH", "MEDIUM", "LOW", "HIGH")
+EXAMPLE_SYMBOLS = ("PEPE/USDT", "SOL/USDT", "DOGE/USDT", "BTC/USDT")
+
+PAYLOAD_COUNT = len(EXAMPLE_EVENT_TYPES)
+
+# ============================================
+# DISPLAY LAYOUT
+# ============================================
+
+# One row per field, in EVENT / CONF / PAIR order:
+# (label x, label y, label text, value x, value y)
+LABEL_LAYOUT = (
+    (10, 20, "EVENT:", 10, 35),
+    (10, 60, "CONF:", 10, 75),
+    (10, 100, "PAIR:", 10, 115)
+)
+
+# Size of the region cleared behind each value on redraw
+VALUE_WIDTH = 120
+VALUE_HEIGHT = 16
 
 # Current payload index
 current_index = 0
@@ -42,42 +44,41 @@ current_index = 0
 # DISPLAY LOGIC
 # ============================================
 
-def display_event(event_payload):
-    """
-    Render event payload on M5StickC Plus2 screen
-    
-    Args:
-        event_payload: Dict with keys: event_type, confidence, symbol
-    """
-    # Clear screen to black
+def draw_labels():
+    """Clear the screen and draw the static row labels (once, at boot)"""
     M5.Lcd.fillScreen(0x000000)
     
-    # Extract values with safe defaults
-    event_type = event_payload.get("event_type", "UNKNOWN")
-    confidence = event_payload.get("confidence", "N/A")
-    symbol = event_payload.get("symbol", "N/A")
-    
-    # Configure text display
+    # Text settings persist, so they are configured here only
     M5.Lcd.setTextColor(0xFFFFFF)
     M5.Lcd.setTextSize(1)
     
-    # Display EVENT TYPE
-    M5.Lcd.setCursor(10, 20)
-    M5.Lcd.print("EVENT:")
-    M5.Lcd.setCursor(10, 35)
-    M5.Lcd.print(event_type)
+    for label_x, label_y, label, _, _ in LABEL_LAYOUT:
+        M5.Lcd.setCursor(label_x, label_y)
+        M5.Lcd.print(label)
+
+
+def display_event(index):
+    """
+    Render an example payload on M5StickC Plus2 screen
+    
+    Only the three value regions are cleared and redrawn; the labels
+    stay on screen from draw_labels().
     
-    # Display CONFIDENCE
-    M5.Lcd.setCursor(10, 60)
-    M5.Lcd.print("CONF:")
-    M5.Lcd.setCursor(10, 75)
-    M5.Lcd.print(confidence)
+    Args:
+        index: Position of the payload in the EXAMPLE_* tuples
+    """
+    # Read the payload's fields from the example columns
+    values = (
+        EXAMPLE_EVENT_TYPES[index],
+        EXAMPLE_CONFIDENCES[index],
+        EXAMPLE_SYMBOLS[index]
+    )
     
-    # Display TRADING PAIR
-    M5.Lcd.setCursor(10, 100)
-    M5.Lcd.print("PAIR:")
-    M5.Lcd.setCursor(10, 115)
-    M5.Lcd.print(symbol)
+    # Redraw EVENT TYPE, CONFIDENCE and TRADING PAIR values
+    for (_, _, _, value_x, value_y), value in zip(LABEL_LAYOUT, values):
+        M5.Lcd.fillRect(value_x, value_y, VALUE_WIDTH, VALUE_HEIGHT, 0x000000)
+        M5.Lcd.setCursor(value_x, value_y)
+        M5.Lcd.print(value)
 
 
 # ============================================
@@ -89,9 +90,10 @@ def setup():
     global current_index
     
     M5.begin()
+    draw_labels()
     
     # Display first example payload on boot
-    display_event(EXAMPLE_PAYLOADS[current_index])
+    display_event(current_index)
 
 
 # ============================================
@@ -106,13 +108,13 @@ def loop():
     
     # Button A: Next payload
     if BtnA.wasPressed():
-        current_index = (current_index + 1) % len(EXAMPLE_PAYLOADS)
-        display_event(EXAMPLE_PAYLOADS[current_index])
+        current_index = (current_index + 1) % PAYLOAD_COUNT
+        display_event(current_index)
     
     # Button B: Previous payload
     if BtnB.wasPressed():
-        current_index = (current_index - 1) % len(EXAMPLE_PAYLOADS)
-        display_event(EXAMPLE_PAYLOADS[current_index])
+        current_index = (current_index - 1) % PAYLOAD_COUNT
+        display_event(current_index)
 
 
 # ============================================
@@ -1,33 +1,48 @@
 import M5
 from M5 import *
 
-def display_event(event_dict):
-    M5.Lcd.fillScreen(0x000000)
+_prev = {"event_type": None, "confidence": None, "symbol": None}
+
+VALUE_FIELDS = (
+    ("event_type", "UNKNOWN", 40),
+    ("confidence", "N/A", 90),
+    ("symbol", "N/A", 140),
+)
 
-    event_type = event_dict.get("event_type", "UNKNOWN")
-    confidence = event_dict.get("confidence", "N/A")
-    symbol = event_dict.get("symbol", "N/A")
+def draw_labels():
+    M5.Lcd.fillScreen(0x000000)
 
     M5.Lcd.setTextColor(0xFFFFFF)
     M5.Lcd.setTextSize(1)
 
     M5.Lcd.setCursor(10, 20)
     M5.Lcd.print("EVENT:")
-    M5.Lcd.setCursor(10, 40)
-    M5.Lcd.print(event_type)
 
     M5.Lcd.setCursor(10, 70)
     M5.Lcd.print("CONF:")
-    M5.Lcd.setCursor(10, 90)
-    M5.Lcd.print(confidence)
 
     M5.Lcd.setCursor(10, 120)
     M5.Lcd.print("PAIR:")
-    M5.Lcd.setCursor(10, 140)
-    M5.Lcd.print(symbol)
+
+def display_event(event):
+    # Accepts a pipeline Payload (named fields) or a plain dict
+    is_dict = isinstance(event, dict)
+    for key, default, y in VALUE_FIELDS:
+        if is_dict:
+            value = event.get(key, default)
+        else:
+            value = getattr(event, key, default)
+        if value == _prev[key]:
+            continue
+
+        M5.Lcd.fillRect(10, y, 200, 10, 0x000000)
+        M5.Lcd.setCursor(10, y)
+        M5.Lcd.print(value)
+        _prev[key] = value
 
 def setup():
     M5.begin()
+    draw_labels()
 
     test_event = {
         "event_type": "NEW_LISTING",
@@ -1,6 +1,6 @@
 """
 M5StickC Plus2 - Event Display MVP
-Displays crypto event data from payload dict
+Displays crypto event data from example payloads
 Local simulation only (no networking)
 Payload cycling via hardware buttons
 """
@@ -13,71 +13,75 @@ import time
 # EVENT PAYLOAD EXAMPLES (TEST DATA)
 # ============================================
 
-EXAMPLE_PAYLOADS = [
-    {
-        "event_type": "NEW_LISTING",
-        "confidence": "HIGH",
-        "symbol": "PEPE/USDT"
-    },
-    {
-        "event_type": "VOLUME_SPIKE",
-        "confidence": "MEDIUM",
-        "symbol": "SOL/USDT"
-    },
-    {
-        "event_type": "WHALE_BUY",
-        "confidence": "LOW",
-        "symbol": "DOGE/USDT"
-    },
-    {
-        "event_type": "PRICE_BREAKOUT",
-        "confidence": "HIGH",
-        "symbol": "BTC/USDT"
-    }
-]
+# Stored column-wise: payload i is (EXAMPLE_EVENT_TYPES[i],
+# EXAMPLE_CONFIDENCES[i], EXAMPLE_SYMBOLS[i]). Three tuples of shared
+# strings take far less RAM than one dict per payload.
+EXAMPLE_EVENT_TYPES = ("NEW_LISTING", "VOLUME_SPIKE", "WHALE_BUY", "PRICE_BREAKOUT")
+EXAMPLE_CONFIDENCES = ("HIGH", "MEDIUM", "LOW", "HIGH")
+EXAMPLE_SYMBOLS = ("PEPE/USDT", "SOL/USDT", "DOGE/USDT", "BTC/USDT")
+
+PAYLOAD_COUNT = len(EXAMPLE_EVENT_TYPES)
+
+# Display rows: (label x, label y, label text, value x, value y)
+LABEL_LAYOUT = (
+    (10, 20, "EVENT:", 10, 35),
+    (10, 60, "CONF:", 10, 75),
+    (10, 100, "PAIR:", 10, 115)
+)
 
 current_index = 0
 
+# Off-screen buffer for one value row, created in setup()
+VALUE_WIDTH = 120
+VALUE_HEIGHT = 16
+canvas = None
+
 # ============================================
 # DISPLAY LOGIC
 # ============================================
 
-def display_event(event_payload):
-    """
-    Render event payload on M5StickC Plus2 screen
-    """
+def draw_labels():
     M5.Lcd.fillScreen(0x000000)
-
-    event_type = event_payload.get("event_type", "UNKNOWN")
-    confidence = event_payload.get("confidence", "N/A")
-    symbol = event_payload.get("symbol", "N/A")
-
     M5.Lcd.setTextColor(0xFFFFFF)
     M5.Lcd.setTextSize(1)
 
-    M5.Lcd.setCursor(10, 20)
-    M5.Lcd.print("EVENT:")
-    M5.Lcd.setCursor(10, 35)
-    M5.Lcd.print(event_type)
+    for label_x, label_y, label, _, _ in LABEL_LAYOUT:
+        M5.Lcd.setCursor(label_x, label_y)
+        M5.Lcd.print(label)
 
-    M5.Lcd.setCursor(10, 60)
-    M5.Lcd.print("CONF:")
-    M5.Lcd.setCursor(10, 75)
-    M5.Lcd.print(confidence)
-
-    M5.Lcd.setCursor(10, 100)
-    M5.Lcd.print("PAIR:")
-    M5.Lcd.setCursor(10, 115)
-    M5.Lcd.print(symbol)
+def display_event(index):
+    """
+    Render an example payload on M5StickC Plus2 screen.
+    Labels are static (see draw_labels); only the value rows are
+    redrawn. Each row is composed on the row canvas and pushed to its
+    region in a single transfer, so the update does not flicker.
+    """
+    values = (
+        EXAMPLE_EVENT_TYPES[index],
+        EXAMPLE_CONFIDENCES[index],
+        EXAMPLE_SYMBOLS[index]
+    )
+
+    for (_, _, _, value_x, value_y), value in zip(LABEL_LAYOUT, values):
+        canvas.fillScreen(0x000000)
+        canvas.setCursor(0, 0)
+        canvas.print(value)
+        canvas.push(value_x, value_y)
 
 # ============================================
 # INITIALIZATION
 # ============================================
 
 def setup():
-    global current_index
+    global current_index, canvas
     M5.begin()
-    display_event(EXAMPLE_PAYLOADS[current_index])
+    draw_labels()
+
+    canvas = M5.Lcd.newCanvas(VALUE_WIDTH, VALUE_HEIGHT, 16, True)
+    canvas.setTextColor(0xFFFFFF)
+    canvas.setTextSize(1)
+
+    display_event(current_index)
 
 # ============================================
 # MAIN LOOP
@@ -88,18 +92,22 @@ def loop():
     M5.update()
 
     if BtnA.wasPressed():
-        current_index = (current_index + 1) % len(EXAMPLE_PAYLOADS)
-        display_event(EXAMPLE_PAYLOADS[current_index])
+        current_index = (current_index + 1) % PAYLOAD_COUNT
+        display_event(current_index)
 
     if BtnB.wasPressed():
-        current_index = (current_index - 1) % len(EXAMPLE_PAYLOADS)
-        display_event(EXAMPLE_PAYLOADS[current_index])
+        current_index = (current_index - 1) % PAYLOAD_COUNT
+        display_event(current_index)
 
 # ============================================
 # ENTRY POINT
 # ============================================
 
 if __name__ == '__main__':
-    setup()
-    while True:
-        loop()
+    try:
+        setup()
+        while True:
+            loop()
+    finally:
+        if canvas is not None:
+            canvas.delete()
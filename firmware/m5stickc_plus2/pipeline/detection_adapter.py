@@ -1,32 +1,50 @@
+import asyncio
+import hashlib
 import json
+import logging
 import os
+import sys
+import threading
 import requests
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timezone
 
-OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
+try:
+    import orjson
 
-DETECTION_SYSTEM_PROMPT = """
-You are a DETECTION module.
-You must output ONLY valid JSON.
-No explanations. No markdown.
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
 
-Allowed values:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
-event_type:
-- POLITICAL_STATEMENT
-- GLOBAL_EVENT
-- MACRO_SHOCK
+logger = logging.getLogger(__name__)
 
-confidence:
-- LOW
-- MEDIUM
-- HIGH
+OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
 
-source MUST be one of:
-- TRUMP_STATEMENT
-- GLOBAL_NEWS
-- GEOPOLITICS
-- OFFICIAL_RELEASE
+# Shared HTTPS session: keeps pooled keep-alive connections to the API
+# so only the first detect() call pays the TCP + TLS handshake.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Detection vocabularies. These tuples are the single definition used by
+# both the response schema and output validation; tuple order keeps the
+# serialized schema byte-stable across runs.
+DETECTION_EVENT_TYPES = ("POLITICAL_STATEMENT", "GLOBAL_EVENT", "MACRO_SHOCK")
+DETECTION_CONFIDENCE_LEVELS = ("LOW", "MEDIUM", "HIGH")
+DETECTION_SOURCES = (
+    "TRUMP_STATEMENT",
+    "GLOBAL_NEWS",
+    "GEOPOLITICS",
+    "OFFICIAL_RELEASE",
+)
+
+DETECTION_SYSTEM_PROMPT = """
+You are a DETECTION module.
+Classify the input as a global news event.
 
 entities RULES (CRITICAL):
 - Extract ONLY global actors: countries, leaders, institutions
@@ -37,57 +55,153 @@ entities RULES (CRITICAL):
 
 Rules:
 - If Trump is the speaker → source = TRUMP_STATEMENT
-- Do NOT invent new source labels
 - Be conservative: HIGH only for clear global-impact events
-
-JSON schema:
-{
-  "event_type": "...",
-  "confidence": "...",
-  "source": "...",
-  "entities": ["..."],
-  "timestamp": "ISO-8601"
-}
 """
 
-ALLOWED_SOURCES = {
-    "TRUMP_STATEMENT",
-    "GLOBAL_NEWS",
-    "GEOPOLITICS",
-    "OFFICIAL_RELEASE",
+# Structured output: the API constrains decoding to this schema, so the
+# completion is always a bare JSON object with only allowed values.
+# The timestamp is not requested; detect() stamps it locally.
+DETECTION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "detection",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "event_type": {
+                    "type": "string",
+                    "enum": list(DETECTION_EVENT_TYPES),
+                },
+                "confidence": {
+                    "type": "string",
+                    "enum": list(DETECTION_CONFIDENCE_LEVELS),
+                },
+                "source": {
+                    "type": "string",
+                    "enum": list(DETECTION_SOURCES),
+                },
+                "entities": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                },
+            },
+            "required": ["event_type", "confidence", "source", "entities"],
+            "additionalProperties": False,
+        },
+    },
 }
 
+# The static part of every request (model params + system prompt) is
+# serialized once; each call only encodes the user message and splices
+# it in.
+_STATIC_SYSTEM_MSG = {"role": "system", "content": DETECTION_SYSTEM_PROMPT}
+
+_REQUEST_BODY_PREFIX = (
+    _json_dumps({
+        "model": "gpt-4o-mini",
+        "temperature": 0,
+        "max_tokens": 300,
+        "response_format": DETECTION_RESPONSE_FORMAT,
+    })[:-1]
+    + b',"messages":['
+    + _json_dumps(_STATIC_SYSTEM_MSG)
+    + b","
+)
+_REQUEST_BODY_SUFFIX = b"]}"
+
+
+def _build_request_body(raw_text: str) -> bytes:
+    return (
+        _REQUEST_BODY_PREFIX
+        + _json_dumps({"role": "user", "content": raw_text})
+        + _REQUEST_BODY_SUFFIX
+    )
+
+
+ALLOWED_SOURCES = frozenset(DETECTION_SOURCES)
+
+_INTERNED_FIELDS = ("event_type", "confidence", "source")
+
+# Exact-match detection cache: the same headline is typically scraped
+# many times, and re-classifying it costs a full LLM round trip.
+# Keyed by a fixed-size digest of the raw text to bound key memory.
+DETECTION_CACHE_SIZE = 1024
+
+_detection_cache: "OrderedDict[bytes, dict]" = OrderedDict()
+_detection_cache_lock = threading.Lock()
+
+
+def _cache_key(raw_text: str) -> bytes:
+    return hashlib.blake2b(raw_text.encode("utf-8"), digest_size=16).digest()
+
+
+def clear_detection_cache() -> None:
+    with _detection_cache_lock:
+        _detection_cache.clear()
+
+
 def detect(raw_text: str) -> dict:
+    key = _cache_key(raw_text)
+    with _detection_cache_lock:
+        cached = _detection_cache.get(key)
+        if cached is not None:
+            _detection_cache.move_to_end(key)
+
+    if cached is None:
+        cached = _detect_uncached(raw_text)
+        with _detection_cache_lock:
+            _detection_cache[key] = cached
+            if len(_detection_cache) > DETECTION_CACHE_SIZE:
+                _detection_cache.popitem(last=False)
+
+    result = dict(cached)
+    result["entities"] = list(cached.get("entities") or ())
+    result["timestamp"] = datetime.now(timezone.utc).isoformat()
+    return result
+
+
+def _prewarm() -> None:
+    # Opens a pooled connection (TCP + TLS) ahead of the first detection;
+    # the response itself is irrelevant.
+    try:
+        _SESSION.head("https://api.openai.com/v1/models", timeout=3)
+    except requests.RequestException:
+        pass
+
+
+async def detect_async(raw_text: str) -> dict:
+    # Runs the blocking detect() in a worker thread so several texts can
+    # be in flight at once while still sharing _SESSION's connection pool
+    # and the detection cache.
+    return await asyncio.to_thread(detect, raw_text)
+
+
+def _detect_uncached(raw_text: str) -> dict:
     api_key = os.environ.get("OPENAI_API_KEY")
 
     if not api_key or not api_key.startswith("sk-"):
         raise RuntimeError("OPENAI_API_KEY NOT LOADED")
 
-    response = requests.post(
+    response = _SESSION.post(
         OPENAI_API_URL,
         headers={
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         },
-        json={
-            "model": "gpt-4o-mini",
-            "messages": [
-                {"role": "system", "content": DETECTION_SYSTEM_PROMPT},
-                {"role": "user", "content": raw_text},
-            ],
-            "temperature": 0,
-            "max_tokens": 300,
-        },
+        data=_build_request_body(raw_text),
         timeout=20,
     )
 
     if response.status_code != 200:
         raise RuntimeError(f"OPENAI ERROR {response.status_code}: {response.text}")
 
-    result = json.loads(response.json()["choices"][0]["message"]["content"])
-
-    print("DEBUG SOURCE BEFORE OVERRIDE:", result.get("source"))
+    # Parse straight from the raw body bytes (no response.text decode).
+    data = _json_loads(response.content)
+    result = _json_loads(data["choices"][0]["message"]["content"])
 
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("SOURCE BEFORE OVERRIDE: %r", result.get("source"))
 
     # Hard override Trump
     if "trump" in raw_text.lower():
@@ -96,5 +210,16 @@ def detect(raw_text: str) -> dict:
     if result.get("source") not in ALLOWED_SOURCES:
         raise RuntimeError(f"INVALID SOURCE: {result.get('source')}")
 
-    result["timestamp"] = datetime.now(timezone.utc).isoformat()
+    # The enum fields come from a closed vocabulary. Interning them makes
+    # repeated values the same object, so the filter's normalizer cache
+    # and its event_type lookups compare keys by identity. The filter
+    # upper-cases source and confidence only on a cache miss.
+    for field in _INTERNED_FIELDS:
+        value = result.get(field)
+        if isinstance(value, str):
+            result[field] = sys.intern(value)
+
     return result
+
+
+threading.Thread(target=_prewarm, daemon=True).start()
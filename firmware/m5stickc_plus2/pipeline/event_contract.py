@@ -23,22 +23,49 @@ This is production-critical infrastructure.
 False positives are unacceptable.
 """
 
-from typing import Optional, Dict, List, Any
-
-
-ALLOWED_EVENT_TYPES: List[str] = [
+import asyncio
+import logging
+import struct
+import sys
+import time
+from collections import OrderedDict
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType, ModuleType
+from typing import (
+    Optional, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping,
+    NamedTuple, Tuple, Any
+)
+
+# Detection is optional: filtering works without it (and without its
+# HTTP dependencies); only the raw-text entry points need it. It is
+# imported on the first raw-text call, so importing this module has no
+# network side effects.
+_adapter: Optional[ModuleType] = None
+_detect_import_error: Optional[ImportError] = None
+
+
+logger = logging.getLogger(__name__)
+
+ALLOWED_EVENT_TYPES: FrozenSet[str] = frozenset({
     "POLITICAL_STATEMENT",
     "GLOBAL_EVENT",
     "MACRO_SHOCK"
-]
+})
 
-ALLOWED_SOURCES: List[str] = [
+ALLOWED_SOURCES: FrozenSet[str] = frozenset({
     "GLOBAL_NEWS",
     "POLITICAL_STATEMENT",
     "GEOPOLITICS"
-]
+})
+
+CONFIDENCE_LEVELS: FrozenSet[str] = frozenset({
+    "LOW",
+    "MEDIUM",
+    "HIGH"
+})
 
-GLOBAL_ENTITIES: List[str] = [
+GLOBAL_ENTITIES: FrozenSet[str] = frozenset({
     "TRUMP",
     "USA",
     "CHINA",
@@ -47,130 +74,543 @@ GLOBAL_ENTITIES: List[str] = [
     "NATO",
     "FED",
     "IMF"
-]
-
-
-_last_accepted_event: Optional[Dict[str, Any]] = None
-
+})
+
+# Source aliases emitted by detection, mapped to filter source labels.
+_SOURCE_MAP: Mapping[str, str] = MappingProxyType({
+    "TRUMP": "POLITICAL_STATEMENT",
+    "TRUMP_SOCIAL": "POLITICAL_STATEMENT",
+    "TRUMP_STATEMENT": "POLITICAL_STATEMENT",
+    "NEWS": "GLOBAL_NEWS",
+    "GLOBAL": "GLOBAL_NEWS"
+})
+
+# Default for a missing or None "entities" field.
+_EMPTY_ENTITIES: Tuple[str, ...] = ()
+
+
+# How long an accepted event suppresses identical repeats, and how many
+# recently accepted events are remembered at most. Bounded in time as
+# well as in count, so a genuinely new statement with the same fields
+# (e.g. another Trump-on-China post) is not dropped as a duplicate on a
+# quiet feed.
+DEDUP_MAX_AGE_SECONDS = 600.0
+DEDUP_CAPACITY = 128
+
+
+class _DedupWindow:
+    """
+    Exact sliding-window duplicate detector.
+
+    Maps each accepted event key to its accept time, oldest first. A key
+    is remembered for at most `max_age` seconds and while it is among the
+    last `capacity` accepted events. Lookups compare keys exactly, so
+    there are no false positives.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEDUP_CAPACITY,
+        max_age: float = DEDUP_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._capacity = capacity
+        self._max_age = max_age
+        self._clock = clock
+        self._accepted: "OrderedDict[Tuple[Any, ...], float]" = OrderedDict()
+
+    def __contains__(self, key: Tuple[Any, ...]) -> bool:
+        accepted_at = self._accepted.get(key)
+        return (
+            accepted_at is not None
+            and self._clock() - accepted_at < self._max_age
+        )
 
-def should_accept_event(event_payload: Dict[str, Any]) -> bool:
-    global _last_accepted_event
+    def add(self, key: Tuple[Any, ...]) -> None:
+        now = self._clock()
+        accepted = self._accepted
+        accepted.pop(key, None)
+        accepted[key] = now
+
+        # Evict from the oldest end: overflow first, then expired keys.
+        cutoff = now - self._max_age
+        while len(accepted) > self._capacity:
+            accepted.popitem(last=False)
+        while accepted and next(iter(accepted.values())) <= cutoff:
+            accepted.popitem(last=False)
+
+    def clear(self) -> None:
+        self._accepted.clear()
+
+
+class FilterState:
+    """
+    Mutable filter state for one event stream: the anti-spam memory and
+    the per-rule rejection counters.
+
+    The module keeps a default instance used whenever no state is
+    passed. Producers filtering independent streams in parallel (one
+    per thread or process) should each create their own FilterState and
+    pass it to the filter and batch/stream entry points, since the
+    dedup window is not thread-safe to share.
+    """
+    __slots__ = ("recent", "rejects")
+
+    def __init__(
+        self,
+        capacity: int = DEDUP_CAPACITY,
+        max_age: float = DEDUP_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        # Anti-spam memory: keys of recently accepted events.
+        self.recent = _DedupWindow(capacity, max_age, clock)
+        # Rejections per filter rule, for measuring real-feed selectivity.
+        self.rejects: Dict[str, int] = {
+            "duplicate": 0,
+            "confidence": 0,
+            "event_type": 0,
+            "source": 0,
+            "entities": 0
+        }
+
+    def reset(self) -> None:
+        self.recent.clear()
+        for reason in self.rejects:
+            self.rejects[reason] = 0
+
+
+# State used when callers pass none (the single-stream default).
+_DEFAULT_STATE = FilterState()
+_recent_events = _DEFAULT_STATE.recent
+_reject_reasons = _DEFAULT_STATE.rejects
+
+
+class Payload(NamedTuple):
+    """
+    Accepted event as forwarded to the M5 device.
+
+    Fields are read by attribute; use _asdict() where a mapping is
+    needed (e.g. JSON transport).
+    """
+    event_type: str
+    confidence: str
+    symbol: str
+
+
+def _scalar_reject_reason(
+    source: Optional[str],
+    confidence: Optional[str],
+    event_type: Optional[str]
+) -> Optional[str]:
+    # Returns the failing source/confidence/event_type rule, or None.
+    # A non-string value fails the rule for its field; the isinstance
+    # checks also keep unhashable values away from the frozensets.
+    if not isinstance(source, str) or source not in ALLOWED_SOURCES:
+        return "source"
     
-    confidence = event_payload.get("confidence")
-    source = event_payload.get("source")
+    if confidence is not None and not isinstance(confidence, str):
+        return "confidence"
     
     if source != "POLITICAL_STATEMENT":
         if confidence != "HIGH":
-            return False
-    
-    event_type = event_payload.get("event_type")
-    if event_type not in ALLOWED_EVENT_TYPES:
-        return False
-    
-    if source not in ALLOWED_SOURCES:
-        return False
+            return "confidence"
     
-    entities = event_payload.get("entities", [])
-    has_global_entity = any(
-        entity.upper() in GLOBAL_ENTITIES 
-        for entity in entities
-    )
-    if not has_global_entity:
-        return False
-    
-    if _last_accepted_event is not None:
-        if events_are_identical(event_payload, _last_accepted_event):
-            return False
+    if not isinstance(event_type, str) or event_type not in ALLOWED_EVENT_TYPES:
+        return "event_type"
     
-    _last_accepted_event = event_payload.copy()
-    return True
+    return None
 
 
-def events_are_identical(event1: Dict[str, Any], event2: Dict[str, Any]) -> bool:
-    return (
-        event1.get("event_type") == event2.get("event_type") and
-        event1.get("source") == event2.get("source") and
-        event1.get("confidence") == event2.get("confidence") and
-        event1.get("entities") == event2.get("entities")
+# The source/confidence/event_type rules depend only on three enumerated
+# values, so every valid combination is decided once at import. Values
+# outside these vocabularies fall back to _scalar_reject_reason().
+_DECISION_TABLE: Dict[Tuple[str, str, str], Optional[str]] = {
+    (source, confidence, event_type): _scalar_reject_reason(
+        source, confidence, event_type
     )
+    for source in ALLOWED_SOURCES
+    for confidence in CONFIDENCE_LEVELS
+    for event_type in ALLOWED_EVENT_TYPES
+}
+
+_UNDECIDED = object()
+
+
+def reset_state(state: Optional[FilterState] = None) -> None:
+    (_DEFAULT_STATE if state is None else state).reset()
+
+
+@lru_cache(maxsize=256)
+def _normalize_fields(
+    source: Any,
+    confidence: Any
+) -> Tuple[Any, Any]:
+    # Shared by normalize_event and the filter. Non-string values pass
+    # through unchanged for the filter rules to reject.
+    if isinstance(source, str):
+        source = source.upper()
+        source = sys.intern(_SOURCE_MAP.get(source, source))
+
+    if isinstance(confidence, str):
+        confidence = sys.intern(confidence.upper())
+
+    return source, confidence
 
 
-def reset_state() -> None:
-    global _last_accepted_event
-    _last_accepted_event = None
+@lru_cache(maxsize=1024)
+def _normalize_entities(entities: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(map(sys.intern, map(str.upper, entities)))
 
 
-def normalize_event(event: Dict[str, Any]) -> Dict[str, Any]:
-    event = event.copy()
+def _normalize_inplace(event: Dict[str, Any]) -> Dict[str, Any]:
+    source, confidence = _normalize_fields(
+        event.get("source"),
+        event.get("confidence")
+    )
 
     if "confidence" in event:
-        event["confidence"] = event["confidence"].upper()
-
-    SOURCE_MAP = {
-        "TRUMP": "POLITICAL_STATEMENT",
-        "TRUMP_SOCIAL": "POLITICAL_STATEMENT",
-        "TRUMP_STATEMENT": "POLITICAL_STATEMENT",
-        "NEWS": "GLOBAL_NEWS",
-        "GLOBAL": "GLOBAL_NEWS"
-    }
+        event["confidence"] = confidence
+
     if "source" in event:
-        event["source"] = SOURCE_MAP.get(
-            event["source"].upper(),
-            event["source"].upper()
-        )
+        event["source"] = source
 
-    if "entities" in event and isinstance(event["entities"], list):
-        event["entities"] = [e.upper() for e in event["entities"]]
+    entities = event.get("entities")
+    if isinstance(entities, (list, tuple)):
+        event["entities"] = _normalize_entities(tuple(entities))
 
     return event
 
 
-def process_event(event_payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    if not should_accept_event(event_payload):
+def normalize_event(event: Dict[str, Any], *, copy: bool = True) -> Dict[str, Any]:
+    # copy=False normalizes the caller's dict in place; only pass it for
+    # payloads the caller owns (e.g. a dict freshly returned by detect()).
+    return _normalize_inplace(event.copy() if copy else event)
+
+
+_DEFAULT_SYMBOL_PARTS = ("GLOBAL", "NEWS")
+
+
+@lru_cache(maxsize=1024)
+def _symbol(entities: Tuple[str, ...]) -> str:
+    # Missing first/second entities are filled from the defaults.
+    first, second = entities[:2] + _DEFAULT_SYMBOL_PARTS[len(entities):]
+    return first + "/" + second
+
+
+def filter_and_format(
+    raw_event: Dict[str, Any],
+    state: Optional[FilterState] = None,
+    *,
+    _normalize=_normalize_fields,
+    _normalize_entities=_normalize_entities,
+    _decide=_DECISION_TABLE.get,
+    _undecided=_UNDECIDED,
+    _no_global_entity=GLOBAL_ENTITIES.isdisjoint,
+    _recent=_recent_events,
+    _rejects=_reject_reasons
+) -> Optional[Payload]:
+    """
+    Normalize, filter and format an event in a single pass.
+
+    Normalization, every filter rule and payload formatting happen
+    here, and every field is read and normalized once.
+
+    Anti-spam memory and rejection counts live in `state` (the module
+    default when omitted).
+
+    The keyword-only underscore parameters bind module globals as
+    locals; they are not part of the API.
+    """
+    if state is not None:
+        _recent = state.recent
+        _rejects = state.rejects
+    
+    get = raw_event.get
+    
+    try:
+        source, confidence = _normalize(get("source"), get("confidence"))
+    except TypeError:
+        # An unhashable field value misses the cache; the rules below
+        # reject it.
+        source, confidence = _normalize.__wrapped__(
+            get("source"),
+            get("confidence")
+        )
+    
+    event_type = get("event_type")
+    
+    try:
+        reason = _decide((source, confidence, event_type), _undecided)
+    except TypeError:
+        # An unhashable field value, which no vocabulary contains.
+        reason = _undecided
+    if reason is _undecided:
+        reason = _scalar_reject_reason(source, confidence, event_type)
+    if reason is not None:
+        _rejects[reason] += 1
         return None
     
-    entities = event_payload.get("entities", [])
+    entities = _normalize_entities(tuple(get("entities") or _EMPTY_ENTITIES))
+    if _no_global_entity(entities):
+        _rejects["entities"] += 1
+        return None
     
-    if len(entities) >= 2:
-        symbol = f"{entities[0]}/{entities[1]}"
-    elif len(entities) == 1:
-        symbol = f"{entities[0]}/NEWS"
-    else:
-        symbol = "GLOBAL/NEWS"
+    key = (event_type, source, confidence, entities)
+    if key in _recent:
+        _rejects["duplicate"] += 1
+        return None
     
-    return {
-        "event_type": event_payload.get("event_type"),
-        "confidence": event_payload.get("confidence"),
-        "symbol": symbol
-    }
+    _recent.add(key)
+    
+    return Payload(event_type, confidence, _symbol(entities))
+
+
+process_event = filter_and_format
+
+
+def should_accept_event(
+    event: Dict[str, Any],
+    state: Optional[FilterState] = None
+) -> bool:
+    # The same gate as process_event (and the same dedup window), with
+    # the formatted payload discarded.
+    return filter_and_format(event, state) is not None
+
+
+def process_events(
+    batch: List[Dict[str, Any]],
+    state: Optional[FilterState] = None
+) -> List[Optional[Payload]]:
+    """
+    Batch variant of process_event.
+
+    Returns one result per input, in order; each event goes through the
+    same single-pass filter, so the batch and per-event gates cannot
+    drift apart.
+    """
+    return [filter_and_format(event, state) for event in batch]
+
+
+class EventType(IntEnum):
+    POLITICAL_STATEMENT = 1
+    GLOBAL_EVENT = 2
+    MACRO_SHOCK = 3
+
+
+class Confidence(IntEnum):
+    # POLITICAL_STATEMENT events bypass the confidence rule, so an
+    # accepted payload may carry a missing or non-vocabulary confidence.
+    UNKNOWN = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+
+
+# Compact wire format for the M5 link: event type id and confidence id
+# (one byte each), symbol length (two bytes, little-endian), then the
+# UTF-8 symbol. The ids are the enum values above.
+_EVENT_TYPE_IDS: Mapping[str, EventType] = MappingProxyType(
+    {member.name: member for member in EventType}
+)
+
+_CONFIDENCE_IDS: Mapping[str, Confidence] = MappingProxyType(
+    {member.name: member for member in Confidence if member}
+)
+
+_BINARY_HEADER = struct.Struct("<BBH")
+
+
+def encode_payload(payload: Payload) -> bytes:
+    # Cannot fail for an accepted payload: event types are always in the
+    # vocabulary, and a symbol (two entity names) is far below the 64 KiB
+    # limit. A missing or non-vocabulary confidence is sent as UNKNOWN
+    # (0), so it decodes as "UNKNOWN" rather than the original value.
+    symbol = payload.symbol.encode("utf-8")
+    return _BINARY_HEADER.pack(
+        _EVENT_TYPE_IDS[payload.event_type],
+        _CONFIDENCE_IDS.get(payload.confidence, Confidence.UNKNOWN),
+        len(symbol)
+    ) + symbol
+
+
+def decode_payload(data: bytes) -> Payload:
+    # Inverse of encode_payload, mapping the ids back to display labels.
+    # Raises ValueError on a truncated frame or an unknown id.
+    start = _BINARY_HEADER.size
+    if len(data) < start:
+        raise ValueError(f"Truncated payload header: {len(data)} bytes")
+    event_type, confidence, length = _BINARY_HEADER.unpack_from(data)
+    if len(data) < start + length:
+        raise ValueError(
+            f"Truncated payload: {len(data) - start} of {length} symbol bytes"
+        )
+    return Payload(
+        EventType(event_type).name,
+        Confidence(confidence).name,
+        data[start:start + length].decode("utf-8")
+    )
 
 
-def process_raw_text(raw_text: str) -> Optional[Dict[str, Any]]:
-    try:
-        from detection_adapter import detect
+def process_event_binary(
+    event_payload: Dict[str, Any],
+    state: Optional[FilterState] = None
+) -> Optional[bytes]:
+    """
+    Same filtering as process_event, but returns the accepted payload in
+    the compact binary wire format (a few bytes instead of ~70 bytes of
+    JSON), or None if the event is rejected.
+    """
+    payload = process_event(event_payload, state)
+    if payload is None:
+        return None
+    return encode_payload(payload)
+
+
+def _process_detection(
+    detection_result: Any,
+    state: Optional[FilterState] = None
+) -> Optional[Payload]:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("DETECTION RAW: %r", detection_result)
+
+    if not isinstance(detection_result, dict):
+        return None
+
+    # process_event normalizes as part of its single pass.
+    result = process_event(detection_result, state)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("FINAL RESULT: %r", result)
+    return result
+
+
+def _detection_adapter() -> Optional[ModuleType]:
+    # Imports detection_adapter once, on first use; None if unavailable.
+    global _adapter, _detect_import_error
 
-        detection_result = detect(raw_text)
-        print("DETECTION RAW:", detection_result)
+    if _adapter is None and _detect_import_error is None:
+        try:
+            import detection_adapter
+        except ImportError as e:
+            _detect_import_error = e
+        else:
+            _adapter = detection_adapter
 
-        if not isinstance(detection_result, dict):
-            return None
+    if _adapter is None:
+        print("IMPORT ERROR:", _detect_import_error)
+    return _adapter
 
-        normalized = normalize_event(detection_result)
-        print("NORMALIZED:", normalized)
-        
-        result = process_event(normalized)
-        print("FINAL RESULT:", result)
-        return result
 
-    except ImportError as e:
-        print("IMPORT ERROR:", e)
+def process_raw_text(
+    raw_text: str,
+    state: Optional[FilterState] = None
+) -> Optional[Payload]:
+    adapter = _detection_adapter()
+    if adapter is None:
         return None
 
+    try:
+        return _process_detection(adapter.detect(raw_text), state)
+
     except Exception as e:
         print("PIPELINE ERROR:", e)
         return None
 
 
+def process_raw_text_stream(
+    raw_texts: Iterable[str],
+    state: Optional[FilterState] = None
+) -> Iterator[Payload]:
+    """
+    Streaming variant of process_raw_text.
+
+    Lazily yields accepted payloads in input order; rejected texts and
+    texts that fail are skipped. Nothing is buffered, so raw_texts may
+    be an unbounded feed. Give each concurrently consumed stream its own
+    FilterState.
+    """
+    adapter = _detection_adapter()
+    if adapter is None:
+        return
+
+    detect = adapter.detect
+    for raw_text in raw_texts:
+        try:
+            result = _process_detection(detect(raw_text), state)
+        except Exception as e:
+            print("PIPELINE ERROR:", e)
+            continue
+
+        if result is not None:
+            yield result
+
+
+def _filter_detections(
+    detection_results: List[Any],
+    state: Optional[FilterState]
+) -> List[Optional[Payload]]:
+    # Filters gathered detections in input order, so anti-spam behaves
+    # exactly as with sequential process_raw_text calls.
+    results: List[Optional[Payload]] = []
+    for detection_result in detection_results:
+        if isinstance(detection_result, Exception):
+            print("PIPELINE ERROR:", detection_result)
+            results.append(None)
+            continue
+
+        try:
+            results.append(_process_detection(detection_result, state))
+        except Exception as e:
+            print("PIPELINE ERROR:", e)
+            results.append(None)
+
+    return results
+
+
+async def process_raw_texts_async(
+    raw_texts: List[str],
+    state: Optional[FilterState] = None
+) -> List[Optional[Payload]]:
+    """
+    Batch variant of process_raw_text for callers inside an event loop.
+
+    Detections run concurrently; filtering then runs in input order.
+    """
+    adapter = _detection_adapter()
+    if adapter is None:
+        return [None] * len(raw_texts)
+
+    detection_results = await asyncio.gather(
+        *(adapter.detect_async(text) for text in raw_texts),
+        return_exceptions=True
+    )
+    return _filter_detections(detection_results, state)
+
+
+def process_raw_texts(
+    raw_texts: List[str],
+    state: Optional[FilterState] = None
+) -> List[Optional[Payload]]:
+    """
+    Batch variant of process_raw_text.
+
+    Detections run concurrently; filtering then runs in input order so
+    anti-spam behaves exactly as with sequential process_raw_text calls.
+    Starts its own event loop; from async code, await
+    process_raw_texts_async() instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "process_raw_texts() cannot run inside an event loop; "
+            "await process_raw_texts_async() instead"
+        )
+
+    return asyncio.run(process_raw_texts_async(raw_texts, state))
+
+
 if __name__ == "__main__":
     print("=== EVENT CONTRACT TESTS ===\n")
     
@@ -230,5 +670,39 @@ if __name__ == "__main__":
     print(f"Test 6 (Trump MEDIUM token): {result_6}")
     print(f"  Status: {'✅ ACCEPTED' if result_6 else '❌ REJECTED'}\n")
     
+    # Simulated clock, so the window can expire without waiting.
+    now = [0.0]
+    window_state = FilterState(clock=lambda: now[0])
+    process_event(test_5, window_state)
+    result_7a = process_event(test_5, window_state)
+    now[0] += DEDUP_MAX_AGE_SECONDS
+    result_7b = process_event(test_5, window_state)
+    print(f"Test 7 (Repeat inside / after dedup window): {result_7a} / {result_7b}")
+    print(f"  Status: {'✅ PASSED' if result_7a is None and result_7b else '❌ FAILED'}\n")
+    
+    # A window of two: a third accepted event pushes out the first.
+    count_state = FilterState(capacity=2)
+    test_8 = [
+        dict(test_5, entities=["USA", entity])
+        for entity in ("CHINA", "RUSSIA", "EU")
+    ]
+    for event in test_8:
+        process_event(event, count_state)
+    result_8a = process_event(test_8[0], count_state)
+    result_8b = process_event(test_8[2], count_state)
+    print(f"Test 8 (Oldest / newest repeat past dedup capacity): {result_8a} / {result_8b}")
+    print(f"  Status: {'✅ PASSED' if result_8a and result_8b is None else '❌ FAILED'}\n")
+    
+    frame_9 = encode_payload(result_5)
+    result_9a = decode_payload(frame_9) == result_5
+    try:
+        decode_payload(frame_9[:-1])
+    except ValueError:
+        result_9b = True
+    else:
+        result_9b = False
+    print(f"Test 9 (Binary round trip / truncated frame rejected): {result_9a} / {result_9b}")
+    print(f"  Status: {'✅ PASSED' if result_9a and result_9b else '❌ FAILED'}\n")
+    
     print("=== SUMMARY ===")
-    print("Expected: ✅ Trump HIGH → ❌ Duplicate → ✅ Trump LOW → ❌ News MEDIUM → ✅ News HIGH → ✅ Trump MEDIUM token")
+    print("Expected: ✅ Trump HIGH → ❌ Duplicate → ✅ Trump LOW → ❌ News MEDIUM → ✅ News HIGH → ✅ Trump MEDIUM token → ✅ Repeat accepted after window → ✅ Oldest repeat accepted past capacity → ✅ Binary round trip")
@@ -5,7 +5,14 @@ Minimal end-to-end smoke test for the event pipeline.
 Purpose: validate Detection → Filtering → Payload flow.
 """
 
-from event_contract import process_raw_text, reset_state
+import logging
+
+from event_contract import (
+    process_event,
+    process_raw_text,
+    process_raw_text_stream,
+    reset_state
+)
 
 TEST_CASES = [
     # Noise (must be rejected)
@@ -26,6 +33,7 @@ TEST_CASES = [
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     print("=== PIPELINE SMOKE TEST ===\n")
     reset_state()
 
@@ -35,14 +43,21 @@ if __name__ == "__main__":
         print("Output:", result)
         print("-" * 40)
 
-print("\n=== FORCED EVENT TEST ===")
+    print("\n=== STREAM TEST ===")
+    reset_state()
+
+    # Same cases through the streaming entry point: only accepted
+    # payloads come out (detections are served from the adapter cache).
+    for result in process_raw_text_stream(TEST_CASES):
+        print("Accepted:", result)
+
+    print("\n=== FORCED EVENT TEST ===")
 
-forced_event = {
-    "event_type": "POLITICAL_STATEMENT",
-    "confidence": "HIGH",
-    "source": "POLITICAL_STATEMENT",
-    "entities": ["TRUMP", "CHINA"]
-}
+    forced_event = {
+        "event_type": "POLITICAL_STATEMENT",
+        "confidence": "HIGH",
+        "source": "POLITICAL_STATEMENT",
+        "entities": ["TRUMP", "CHINA"]
+    }
 
-from event_contract import process_event
-print(process_event(forced_event))
+    print(process_event(forced_event))